@@ -13,3 +13,4 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 from .client import Client
+from .aio import AsyncClient, SyncAioClient
@@ -0,0 +1,226 @@
+"""Copyright 2019 Cisco Systems
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+"""NX-OS gRPC asyncio wrapper library built on grpc.aio.
+Shares request construction and validation with the synchronous Client,
+only channel construction and request fulfillment differ.
+"""
+import asyncio
+import threading
+
+import grpc.aio
+
+from .client import Client
+from .response import build_response_async
+
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop():
+    """Returns the event loop shared by all SyncAioClient instances,
+    starting it in a daemon thread on first use.
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="nxos_grpc-aio", daemon=True
+            ).start()
+            _loop = loop
+    return _loop
+
+
+def _run_on_loop(coroutine):
+    """Runs a coroutine on the shared event loop and blocks for its result."""
+    return asyncio.run_coroutine_threadsafe(coroutine, _get_loop()).result()
+
+
+async def _anext(async_iterator):
+    """Coroutine wrapper around retrieving the next item of an async iterator."""
+    return await async_iterator.__anext__()
+
+
+class _AioClient(Client):
+    """Shared grpc.aio channel construction and request fulfillment
+    for AsyncClient and SyncAioClient.
+    """
+
+    __slots__ = ()
+
+    _channel_api = grpc.aio
+
+    # grpc.aio serializes requests after the call is made, so concurrent
+    # calls on the same thread must not share request arguments.
+    _reuse_request_args = False
+
+    async def _async_close(self):
+        """Closes the channels, cancelling any in-flight RPCs.
+        The next RPC creates new channels on the running event loop.
+        """
+        for channel in self._detach_channels():
+            await channel.close()
+
+    async def _async_fulfill(self, request_method, request_args):
+        """Generically executes a grpc.aio RPC "request".
+
+        Parameters
+        ----------
+        request_method : str
+            Name of the client stub method to execute.
+        request_args : object
+            Arguments to RPC method to execute.
+
+        Returns
+        -------
+        gRPCResponse
+            Response wrapper object with ReqID, YangData, and Errors fields.
+        """
+        return await build_response_async(
+            request_args.ReqID, self._invoke_request(request_method, request_args)
+        )
+
+    async def _async_fulfill_many(self, request_method, requests_args, max_concurrency):
+        """Concurrently executes a grpc.aio RPC "request" per set of arguments,
+        with at most max_concurrency in flight.
+        Returns the gRPCResponses in the order of requests_args.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fulfill(request_args):
+            async with semaphore:
+                return await self._async_fulfill(request_method, request_args)
+
+        return list(
+            await asyncio.gather(
+                *[fulfill(request_args) for request_args in requests_args]
+            )
+        )
+
+    async def _async_stream(self, request_method, request_args):
+        """Executes a server streaming grpc.aio RPC "request", yielding each
+        response chunk as received instead of assembling the response.
+        """
+        req_id = request_args.ReqID
+        async for response in self._invoke_request(request_method, request_args):
+            if response.ReqID != req_id:
+                raise Exception("ReqIDs in response stream do not match!")
+            yield response
+
+
+class AsyncClient(_AioClient):
+    """NX-OS gRPC asyncio wrapper client.
+
+    Same interface as Client, however every RPC method returns an
+    awaitable which resolves to the response wrapper. Many RPCs may be
+    in flight concurrently over a single channel and thread.
+
+    Channels are created on the first RPC and are bound to the event
+    loop running at that time, so an AsyncClient is tied to one event
+    loop. close() the client, or use it as an async context manager,
+    before using it from another event loop.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> from nxos_grpc import AsyncClient
+    >>> async def poll(paths):
+    ...     async with AsyncClient('127.0.0.1', 'demo', 'demo') as client:
+    ...         return await asyncio.gather(*[
+    ...             client.get_oper(path,
+    ...                 namespace='http://cisco.com/ns/yang/cisco-nx-os-device'
+    ...             ) for path in paths
+    ...         ])
+    >>> responses = asyncio.run(poll(['Cisco-NX-OS-device:System']))
+    """
+
+    __slots__ = ()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Closes the channels, cancelling any in-flight RPCs.
+        The next RPC creates new channels on the running event loop.
+        """
+        await self._async_close()
+
+    _fulfill_request = _AioClient._async_fulfill
+    _fulfill_requests = _AioClient._async_fulfill_many
+    _stream_request = _AioClient._async_stream
+
+
+class SyncAioClient(_AioClient):
+    """NX-OS gRPC wrapper client with the blocking Client interface,
+    backed by grpc.aio.
+
+    RPCs are executed on a single event loop running in a background
+    thread shared by all instances, and the calling thread blocks on
+    the result. Channels are created on that loop on first use and
+    reused for all subsequent calls until close().
+
+    Examples
+    --------
+    >>> from nxos_grpc import SyncAioClient
+    >>> with SyncAioClient('127.0.0.1', 'demo', 'demo') as client:
+    ...     oper_response = client.get_oper('Cisco-NX-OS-device:System',
+    ...         namespace='http://cisco.com/ns/yang/cisco-nx-os-device'
+    ...     )
+    """
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Closes the channels on the background event loop, cancelling
+        any in-flight RPCs.
+        """
+        _run_on_loop(self._async_close())
+
+    def _fulfill_request(self, request_method, request_args):
+        """Executes the grpc.aio RPC "request" on the background event loop
+        and blocks until its response is fully assembled.
+        """
+        return _run_on_loop(self._async_fulfill(request_method, request_args))
+
+    def _fulfill_requests(self, request_method, requests_args, max_concurrency):
+        """Executes the grpc.aio RPC "requests" concurrently on the background
+        event loop and blocks until all responses are fully assembled.
+        """
+        return _run_on_loop(
+            self._async_fulfill_many(request_method, requests_args, max_concurrency)
+        )
+
+    def _stream_request(self, request_method, request_args):
+        """Executes a server streaming grpc.aio RPC "request" on the background
+        event loop, blocking for and yielding each response chunk in turn.
+        """
+        stream = self._async_stream(request_method, request_args)
+        try:
+            while True:
+                try:
+                    yield _run_on_loop(_anext(stream))
+                except StopAsyncIteration:
+                    return
+        finally:
+            _run_on_loop(stream.aclose())
@@ -19,18 +19,72 @@ TODO: Make individual returns more useful?
 TODO: Exception classes.
 """
 import logging
-import json
+import functools
+import itertools
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
 
-try:
-    # Python 3
-    from urllib.parse import urlparse
-except ImportError:
-    # Python 2
-    from urlparse import urlparse
 import grpc
 from .response import build_response
 from . import proto
 
+try:
+    from orjson import dumps as _orjson_dumps
+except ImportError:
+    from json import dumps as _dumps
+else:
+
+    def _dumps(obj):
+        """JSON encode obj to str with the optional orjson encoder."""
+        return _orjson_dumps(obj).decode("utf-8")
+
+
+_logger = logging.getLogger(__name__)
+
+_USERNAME_KEY = sys.intern("username")
+_PASSWORD_KEY = sys.intern("password")
+
+_EDIT_OPERATIONS = frozenset({"merge", "create", "replace", "delete", "remove"})
+_DEFAULT_OPERATIONS = frozenset({"merge", "replace", "none"})
+_DATASTORES = frozenset({"running"})
+_ERROR_OPERATIONS = frozenset({"roll-back", "stop", "continue"})
+# Channel arguments tuned for sustained polling over long-lived connections.
+# Keepalive stays within default gRPC server ping enforcement, which allows
+# one ping per 5 minutes and none while idle, to avoid too_many_pings GOAWAYs.
+_DEFAULT_CHANNEL_OPTIONS = {
+    "grpc.keepalive_time_ms": 300000,
+    "grpc.keepalive_timeout_ms": 10000,
+    "grpc.http2.max_pings_without_data": 0,
+    "grpc.http2.min_time_between_pings_ms": 10000,
+    "grpc.max_receive_message_length": 64 * 1024 * 1024,
+    "grpc.http2.initial_window_size": 8 * 1024 * 1024,
+    "grpc.http2.initial_connection_window_size": 16 * 1024 * 1024,
+}
+# Valid option listings for enumeration validation errors.
+_ENUM_OPTIONS_TEXT = {
+    options: ", ".join(sorted(options))
+    for options in (
+        _EDIT_OPERATIONS,
+        _DEFAULT_OPERATIONS,
+        _DATASTORES,
+        _ERROR_OPERATIONS,
+    )
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _load_pem(path, mtime):  # pylint: disable=unused-argument
+    """Reads PEM file contents, cached by path and modification time
+    so that repeated Client construction does not reread the file.
+    mtime is unused in the body but is part of the cache key, so that a
+    rewritten PEM file is reloaded. Do not remove it.
+    """
+    with open(path, "rb") as creds_fd:
+        return creds_fd.read()
+
 
 class Client(object):
     """NX-OS gRPC wrapper client to ease usage of gRPC.
@@ -52,6 +106,12 @@ class Client(object):
         Get only config data.
     get_oper(...)
         Get only oper data.
+    get_oper_many(...)
+        Get only oper data for many XPaths concurrently.
+    get_oper_stream(...)
+        Get only oper data, yielding response chunks as received.
+    get_stream(...)
+        Get oper and config data, yielding response chunks as received.
     edit_config(...)
         Edit running config.
     start_session(...)
@@ -60,6 +120,8 @@ class Client(object):
         Gracefully close stateful session.
     kill_session(...)
         Forcefully terminate stateful session.
+    clear_xpath_cache()
+        Drop cached XPath to JSON conversions.
 
     Examples
     --------
@@ -78,12 +140,40 @@ class Client(object):
     ...
     """
 
+    """Fixed attributes avoid a per-instance __dict__ when managing many devices.
+    Double underscore names are mangled by Python as usual.
+    """
+    __slots__ = (
+        "timeout",
+        "__username",
+        "__password",
+        "__metadata",
+        "__target",
+        "__credentials",
+        "__options",
+        "__compression",
+        "__wait_for_ready",
+        "__pool_size",
+        "__channels",
+        "__client_cycle",
+        "__clients_lock",
+        "__request_args_cache",
+    )
+
     """Defining property due to gRPC timeout being based on a C long type.
     Should really define this based on architecture.
     32-bit C long max value. "Infinity".
     """
     __C_MAX_LONG = 2147483647
 
+    """gRPC API used to construct channels. Subclasses may swap in grpc.aio."""
+    _channel_api = grpc
+
+    """Whether polling request arguments may be reused per thread.
+    Only safe when RPC invocation serializes the request before returning.
+    """
+    _reuse_request_args = True
+
     def __init__(
         self,
         target,
@@ -93,8 +183,13 @@ class Client(object):
         credentials=None,
         credentials_from_file=False,
         tls_server_override=None,
+        compression=grpc.Compression.Gzip,
+        pool_size=1,
+        channel_options=None,
+        wait_for_ready=None,
     ):
-        """Initializes the gRPC client stub and defines authentication and timeout attributes.
+        """Defines the gRPC target, authentication, and timeout attributes.
+        Channels and client stubs are created lazily on the first RPC.
 
         Parameters
         ----------
@@ -111,41 +206,145 @@ class Client(object):
             Indicates that credentials is a file path.
         tls_server_override : str, optional
             TLS server name, if desired.
+        compression : grpc.Compression, optional
+            Compression algorithm for the channel and each call.
+            Defaults to gzip, YANG JSON payloads compress well.
+        pool_size : uint, optional
+            Number of channels to round-robin RPCs across.
+            Each channel uses its own connection to the target.
+        channel_options : dict, optional
+            gRPC channel arguments, overriding the keepalive, flow control
+            and message size defaults. More aggressive keepalive, such as a
+            shorter grpc.keepalive_time_ms or
+            grpc.keepalive_permit_without_calls, requires the server to
+            permit it, otherwise it closes the connection with
+            too_many_pings.
+        wait_for_ready : bool, optional
+            Whether RPCs wait for the channel to become ready, up to the
+            timeout, instead of failing immediately while it is unavailable.
+            Defaults to waiting only when timeout is finite, with the
+            default "infinity" timeout RPCs fail fast. Explicitly True with
+            an "infinite" timeout blocks until the target is reachable.
         """
-        self.username = username
-        self.password = password
+        self.__username = username
+        self.__password = password
+        self.__metadata = self.__gen_metadata(username, password)
         self.timeout = int(timeout)
         self.__target = self.__gen_target(target)
         self.__credentials = self.__gen_credentials(credentials, credentials_from_file)
-        self.__options = self.__gen_options(tls_server_override)
-        self.__client = self.__gen_client(
-            self.__target, self.__credentials, self.__options
-        )
+        self.__options = self.__gen_options(tls_server_override, channel_options)
+        self.__compression = compression
+        self.__wait_for_ready = wait_for_ready
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1!")
+        self.__pool_size = int(pool_size)
+        self.__channels = None
+        self.__client_cycle = None
+        self.__clients_lock = threading.Lock()
+        self.__request_args_cache = threading.local()
 
     def __repr__(self):
-        """JSON dump a dict of basic attributes."""
-        return json.dumps(
-            {
-                "target": self.__target,
-                "is_secure": True if self.__credentials else False,
-                "username": self.username,
-                "password": self.password,
-                "timeout": self.timeout,
-            }
+        """JSON representation of basic attributes.
+        Formatted directly rather than encoding a dict, only the string
+        values need JSON escaping.
+        """
+        return (
+            '{"target": %s, "is_secure": %s, '
+            '"username": %s, "password": %s, "timeout": %d}'
+        ) % (
+            _dumps(self.__target),
+            "true" if self.__credentials else "false",
+            _dumps(self.__username),
+            _dumps(self.__password),
+            self.timeout,
         )
 
-    def __gen_metadata(self):
-        """Generates expected gRPC call metadata."""
-        return [("username", self.username), ("password", self.password)]
+    @property
+    def username(self):
+        """Username sent in the metadata of every RPC."""
+        return self.__username
+
+    @username.setter
+    def username(self, username):
+        """Sets the username and rebuilds the cached call metadata."""
+        self.__username = username
+        self.__metadata = self.__gen_metadata(username, self.__password)
+
+    @property
+    def password(self):
+        """Password sent in the metadata of every RPC."""
+        return self.__password
+
+    @password.setter
+    def password(self, password):
+        """Sets the password and rebuilds the cached call metadata."""
+        self.__password = password
+        self.__metadata = self.__gen_metadata(self.__username, password)
+
+    @property
+    def _client(self):
+        """Next client stub from the channel pool, round-robin.
+        The pool is created on first access.
+        """
+        client_cycle = self.__client_cycle
+        if client_cycle is None:
+            with self.__clients_lock:
+                if self.__client_cycle is None:
+                    self.__channels = [
+                        self.__gen_channel(
+                            self.__target,
+                            self.__credentials,
+                            # Distinct channel args defeat global subchannel sharing.
+                            self.__options + (("grpc.channel_id", channel_id),),
+                            self.__compression,
+                            self._channel_api,
+                        )
+                        for channel_id in range(self.__pool_size)
+                    ]
+                    self.__client_cycle = itertools.cycle(
+                        [
+                            proto.gRPCConfigOperStub(channel)
+                            for channel in self.__channels
+                        ]
+                    )
+                client_cycle = self.__client_cycle
+        return next(client_cycle)
+
+    def _detach_channels(self):
+        """Detaches the channel pool so that the next RPC creates a new one.
+        Returns the detached channels for the caller to close.
+        """
+        with self.__clients_lock:
+            channels = self.__channels or []
+            self.__channels = None
+            self.__client_cycle = None
+        return channels
+
+    def __gen_request_args(self, args_type, **fields):
+        """Generates RPC request arguments of args_type with fields set.
+        When allowed, a per-thread instance of args_type is cleared and
+        reused rather than constructing a new message for every poll.
+        """
+        if not self._reuse_request_args:
+            return args_type(**fields)
+        request_args = getattr(self.__request_args_cache, args_type.__name__, None)
+        if request_args is None:
+            request_args = args_type()
+            setattr(self.__request_args_cache, args_type.__name__, request_args)
+        else:
+            request_args.Clear()
+        for field, value in fields.items():
+            setattr(request_args, field, value)
+        return request_args
 
-    def __fulfill_request(self, request_method, request_args):
+    def _fulfill_request(self, request_method, request_args):
         """Generically executes a gRPC RPC "request".
         All requests follow the same control flow, thus generalization.
 
         Parameters
         ----------
-        request_method : def
-            Method to execute.
+        request_method : str
+            Name of the client stub method to execute.
         request_args : object
             Arguments to RPC method to execute.
 
@@ -155,10 +354,80 @@ class Client(object):
             Response wrapper object with ReqID, YangData, and Errors fields.
         """
         return build_response(
-            request_args.ReqID,
-            request_method(
-                request_args, timeout=self.timeout, metadata=self.__gen_metadata()
-            ),
+            request_args.ReqID, self._invoke_request(request_method, request_args)
+        )
+
+    def _fulfill_requests(self, request_method, requests_args, max_concurrency):
+        """Concurrently executes a gRPC RPC "request" per set of arguments.
+        Requests are issued from a thread pool of max_concurrency workers
+        and multiplexed over the client channel(s).
+
+        Parameters
+        ----------
+        request_method : str
+            Name of the client stub method to execute.
+        requests_args : list
+            Arguments to RPC method to execute, one entry per request.
+        max_concurrency : uint
+            Maximum number of requests in flight at once.
+
+        Returns
+        -------
+        list of gRPCResponse
+            Response wrapper objects in the order of requests_args.
+        """
+        max_workers = max(1, min(max_concurrency, len(requests_args)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    functools.partial(self._fulfill_request, request_method),
+                    requests_args,
+                )
+            )
+
+    def _stream_request(self, request_method, request_args):
+        """Executes a server streaming gRPC RPC "request", yielding each
+        response chunk as received instead of assembling the response.
+
+        Parameters
+        ----------
+        request_method : str
+            Name of the client stub method to execute.
+        request_args : object
+            Arguments to RPC method to execute.
+
+        Yields
+        ------
+        object
+            Raw reply messages with ReqID, YangData, and Errors fields.
+
+        Raises
+        ------
+        Exception
+            Response stream ReqIDs do not match.
+        """
+        req_id = request_args.ReqID
+        for response in self._invoke_request(request_method, request_args):
+            if response.ReqID != req_id:
+                raise Exception("ReqIDs in response stream do not match!")
+            yield response
+
+    def _invoke_request(self, request_method, request_args):
+        """Invokes the named RPC with the per-call options shared by all requests.
+        Returns the raw gRPC response or call object.
+        """
+        # "Infinity" is passed as no deadline rather than a huge one.
+        timeout = None if self.timeout >= self.__C_MAX_LONG else self.timeout
+        wait_for_ready = self.__wait_for_ready
+        if wait_for_ready is None:
+            # Never wait unbounded on an unavailable target by default.
+            wait_for_ready = timeout is not None
+        return getattr(self._client, request_method)(
+            request_args,
+            timeout=timeout,
+            metadata=self.__metadata,
+            compression=self.__compression,
+            wait_for_ready=wait_for_ready,
         )
 
     def get_oper(self, yang_path, namespace=None, request_id=0, path_is_payload=False):
@@ -183,10 +452,90 @@ class Client(object):
         """
         if not path_is_payload:
             yang_path = self.__parse_xpath_to_json(yang_path, namespace)
-        request_args = proto.GetOperArgs(ReqID=request_id, YangPath=yang_path)
-        return self.__fulfill_request(
-            request_method=self.__client.GetOper, request_args=request_args
+        request_args = self.__gen_request_args(
+            proto.GetOperArgs, ReqID=request_id, YangPath=yang_path
         )
+        return self._fulfill_request(
+            request_method="GetOper", request_args=request_args
+        )
+
+    def get_oper_many(
+        self,
+        yang_paths,
+        namespace=None,
+        request_id=0,
+        path_is_payload=False,
+        max_concurrency=16,
+    ):
+        """Get operational data from device for many XPaths concurrently.
+
+        Parameters
+        ----------
+        yang_paths : iterable of str
+            YANG XPaths which locate the datapoints.
+        namespace : str, optional
+            YANG namespace applicable to the specified XPaths.
+        request_id : uint, optional
+            The request ID to indicate to the device for every request.
+        path_is_payload : bool, optional
+            Indicates that the yang_paths contain preformed JSON
+            payloads and should not be parsed into JSON as XPaths.
+        max_concurrency : uint, optional
+            Maximum number of requests in flight at once.
+
+        Returns
+        -------
+        list of gRPCResponse
+            Response wrapper objects in the order of yang_paths.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1!")
+        requests_args = [
+            proto.GetOperArgs(
+                ReqID=request_id,
+                YangPath=(
+                    yang_path
+                    if path_is_payload
+                    else self.__parse_xpath_to_json(yang_path, namespace)
+                ),
+            )
+            for yang_path in yang_paths
+        ]
+        return self._fulfill_requests(
+            request_method="GetOper",
+            requests_args=requests_args,
+            max_concurrency=max_concurrency,
+        )
+
+    def get_oper_stream(
+        self, yang_path, namespace=None, request_id=0, path_is_payload=False
+    ):
+        """Get operational data from device as a stream of response chunks.
+        Avoids holding the entire response in memory for large datasets.
+        YangData chunks are fragments of one JSON document and must be
+        concatenated before parsing.
+
+        Parameters
+        ----------
+        yang_path : str
+            YANG XPath which locates the datapoints.
+        namespace : str, optional
+            YANG namespace applicable to the specified XPath.
+        request_id : uint, optional
+            The request ID to indicate to the device.
+        path_is_payload : bool, optional
+            Indicates that the yang_path parameter contains a preformed JSON
+            payload and should not be parsed into JSON as an XPath.
+
+        Yields
+        ------
+        GetOperReply
+            Raw reply chunks with ReqID, YangData, and Errors fields.
+        """
+        if not path_is_payload:
+            yang_path = self.__parse_xpath_to_json(yang_path, namespace)
+        request_args = proto.GetOperArgs(ReqID=request_id, YangPath=yang_path)
+        return self._stream_request(request_method="GetOper", request_args=request_args)
 
     def get(self, yang_path, namespace=None, request_id=0, path_is_payload=False):
         """Get configuration and operational data from device.
@@ -210,10 +559,41 @@ class Client(object):
         """
         if not path_is_payload:
             yang_path = self.__parse_xpath_to_json(yang_path, namespace)
-        request_args = proto.GetArgs(ReqID=request_id, YangPath=yang_path)
-        return self.__fulfill_request(
-            request_method=self.__client.Get, request_args=request_args
+        request_args = self.__gen_request_args(
+            proto.GetArgs, ReqID=request_id, YangPath=yang_path
         )
+        return self._fulfill_request(request_method="Get", request_args=request_args)
+
+    def get_stream(
+        self, yang_path, namespace=None, request_id=0, path_is_payload=False
+    ):
+        """Get configuration and operational data from device as a stream
+        of response chunks.
+        Avoids holding the entire response in memory for large datasets.
+        YangData chunks are fragments of one JSON document and must be
+        concatenated before parsing.
+
+        Parameters
+        ----------
+        yang_path : str
+            YANG XPath which locates the datapoints.
+        namespace : str, optional
+            YANG namespace applicable to the specified XPath.
+        request_id : uint, optional
+            The request ID to indicate to the device.
+        path_is_payload : bool, optional
+            Indicates that the yang_path parameter contains a preformed JSON
+            payload and should not be parsed into JSON as an XPath.
+
+        Yields
+        ------
+        GetReply
+            Raw reply chunks with ReqID, YangData, and Errors fields.
+        """
+        if not path_is_payload:
+            yang_path = self.__parse_xpath_to_json(yang_path, namespace)
+        request_args = proto.GetArgs(ReqID=request_id, YangPath=yang_path)
+        return self._stream_request(request_method="Get", request_args=request_args)
 
     def get_config(
         self,
@@ -248,14 +628,14 @@ class Client(object):
         -----
         Need to verify whether source param may be something other than running.
         """
-        self.__validate_enum_arg(source, {"running"})
+        self.__validate_enum_arg(source, _DATASTORES)
         if not path_is_payload:
             yang_path = self.__parse_xpath_to_json(yang_path, namespace)
-        request_args = proto.GetConfigArgs(
-            ReqID=request_id, Source=source, YangPath=yang_path
+        request_args = self.__gen_request_args(
+            proto.GetConfigArgs, ReqID=request_id, Source=source, YangPath=yang_path
         )
-        return self.__fulfill_request(
-            request_method=self.__client.GetConfig, request_args=request_args
+        return self._fulfill_request(
+            request_method="GetConfig", request_args=request_args
         )
 
     def edit_config(
@@ -293,12 +673,10 @@ class Client(object):
         gRPCResponse
             Response wrapper object with ReqID, YangData, and Errors fields.
         """
-        self.__validate_enum_arg(
-            operation, {"merge", "create", "replace", "delete", "remove"}
-        )
-        self.__validate_enum_arg(default_operation, {"merge", "replace", "none"})
-        self.__validate_enum_arg(target, {"running"})
-        self.__validate_enum_arg(error_operation, {"roll-back", "stop", "continue"})
+        self.__validate_enum_arg(operation, _EDIT_OPERATIONS)
+        self.__validate_enum_arg(default_operation, _DEFAULT_OPERATIONS)
+        self.__validate_enum_arg(target, _DATASTORES)
+        self.__validate_enum_arg(error_operation, _ERROR_OPERATIONS)
         request_args = proto.EditConfigArgs(
             YangPath=yang_path,
             Operation=operation,
@@ -308,8 +686,8 @@ class Client(object):
             DefOp=default_operation,
             ErrorOp=error_operation,
         )
-        return self.__fulfill_request(
-            request_method=self.__client.EditConfig, request_args=request_args
+        return self._fulfill_request(
+            request_method="EditConfig", request_args=request_args
         )
 
     def start_session(self, request_id=0):
@@ -326,8 +704,8 @@ class Client(object):
             Response wrapper object with ReqID, YangData, and Errors fields.
         """
         request_args = proto.SessionArgs(ReqID=request_id)
-        return self.__fulfill_request(
-            request_method=self.__client.StartSession, request_args=request_args
+        return self._fulfill_request(
+            request_method="StartSession", request_args=request_args
         )
 
     def close_session(self, session_id, request_id=0):
@@ -346,8 +724,8 @@ class Client(object):
             Response wrapper object with ReqID, YangData, and Errors fields.
         """
         request_args = proto.CloseSessionArgs(ReqID=request_id, SessionID=session_id)
-        return self.__fulfill_request(
-            request_method=self.__client.CloseSession, request_args=request_args
+        return self._fulfill_request(
+            request_method="CloseSession", request_args=request_args
         )
 
     def kill_session(self, session_id, session_id_to_kill, request_id=0):
@@ -374,10 +752,17 @@ class Client(object):
         request_args = proto.KillArgs(
             ReqID=request_id, SessionID=session_id, SessionIDToKill=session_id_to_kill
         )
-        return self.__fulfill_request(
-            request_method=self.__client.KillSession, request_args=request_args
+        return self._fulfill_request(
+            request_method="KillSession", request_args=request_args
         )
 
+    @staticmethod
+    def clear_xpath_cache():
+        """Clears the cache of XPath to JSON conversions shared by all
+        Client instances.
+        """
+        Client.__parse_xpath_to_json.cache_clear()
+
     @staticmethod
     def __gen_target(target, netloc_prefix="//", default_port=50051):
         """Parses and validates a supplied target URL for gRPC calls.
@@ -390,30 +775,44 @@ class Client(object):
             target = netloc_prefix + target
         parsed_target = urlparse(target)
         if not parsed_target.netloc:
-            raise ValueError("Unable to parse netloc from target URL %s!", target)
+            raise ValueError("Unable to parse netloc from target URL %s!" % target)
         if parsed_target.scheme:
-            logging.debug("Scheme identified in target, ignoring and using netloc.")
+            _logger.debug("Scheme identified in target, ignoring and using netloc.")
         target_netloc = parsed_target.netloc
         if parsed_target.port is None:
-            ported_target = "%s:%i" % (parsed_target.hostname, default_port)
-            logging.debug("No target port detected, reassembled to %s.", ported_target)
-            target_netloc = Client.__gen_target(ported_target)
+            hostname = parsed_target.hostname
+            if ":" in hostname:
+                # IPv6 literals must remain bracketed when a port is appended.
+                hostname = "[%s]" % hostname
+            target_netloc = "%s:%i" % (hostname, default_port)
+            _logger.debug("No target port detected, reassembled to %s.", target_netloc)
         return target_netloc
 
     @staticmethod
-    def __gen_client(target, credentials=None, options=None):
-        """Instantiates and returns the NX-OS gRPC client stub
-        over an insecure or secure channel.
+    def __gen_metadata(username, password):
+        """Generates expected gRPC call metadata.
+        Metadata is constant per Client, so this is generated once up front
+        rather than on every RPC.
+        """
+        return ((_USERNAME_KEY, username), (_PASSWORD_KEY, password))
+
+    @staticmethod
+    def __gen_channel(
+        target, credentials=None, options=None, compression=None, channel_api=grpc
+    ):
+        """Instantiates and returns an insecure or secure channel
+        for the NX-OS gRPC client stub.
+        channel_api is the module providing the channel constructors,
+        either grpc or grpc.aio.
         """
-        client = None
         if not credentials:
-            insecure_channel = grpc.insecure_channel(target)
-            client = proto.gRPCConfigOperStub(insecure_channel)
-        else:
-            channel_creds = grpc.ssl_channel_credentials(credentials)
-            secure_channel = grpc.secure_channel(target, channel_creds, options)
-            client = proto.gRPCConfigOperStub(secure_channel)
-        return client
+            return channel_api.insecure_channel(
+                target, options, compression=compression
+            )
+        channel_creds = grpc.ssl_channel_credentials(credentials)
+        return channel_api.secure_channel(
+            target, channel_creds, options, compression=compression
+        )
 
     @staticmethod
     def __gen_credentials(credentials, credentials_from_file):
@@ -423,43 +822,51 @@ class Client(object):
         if not credentials:
             return None
         if credentials_from_file:
-            with open(credentials, "rb") as creds_fd:
-                credentials = creds_fd.read()
+            credentials = _load_pem(credentials, os.stat(credentials).st_mtime_ns)
         return credentials
 
     @staticmethod
-    def __gen_options(tls_server_override):
+    def __gen_options(tls_server_override, channel_options=None):
         """Generate options tuple for gRPC overrides, etc.
-        Only TLS server is handled currently.
+        Default channel arguments are merged with any supplied
+        channel_options, which take precedence.
         """
-        options = []
+        options = dict(_DEFAULT_CHANNEL_OPTIONS)
+        if channel_options:
+            options.update(channel_options)
         if tls_server_override:
-            options.append(("grpc.ssl_target_name_override", tls_server_override))
-        return tuple(options)
+            options["grpc.ssl_target_name_override"] = tls_server_override
+        return tuple(options.items())
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def __parse_xpath_to_json(xpath, namespace):
         """Parses an XPath to JSON representation, and appends
         namespace into the JSON request.
+        The JSON is assembled directly as a string rather than building
+        and encoding nested dicts, and results are cached as the same
+        XPaths are typically polled repeatedly. orjson is used to encode
+        the strings if installed.
         """
         if not namespace:
             raise ValueError("Must include namespace if constructing from xpath!")
-        xpath_dict = {}
-        xpath_split = xpath.split("/")
-        first = True
-        for element in reversed(xpath_split):
-            if first:
-                xpath_dict[element] = {}
-                first = False
-            else:
-                xpath_dict = {element: xpath_dict}
-        xpath_dict["namespace"] = namespace
-        return json.dumps(xpath_dict)
+        elements = [element for element in xpath.split("/") if element]
+        members = []
+        if elements:
+            members.append(
+                "".join("%s: {" % _dumps(element) for element in elements)
+                + "}" * len(elements)
+            )
+        members.append('"namespace": %s' % _dumps(namespace))
+        return "{%s}" % ", ".join(members)
 
     @staticmethod
     def __validate_enum_arg(name, valid_options, message=None):
         """Construct error around enumeration validation."""
         if name not in valid_options:
             if not message:
-                message = "%s must be one of %s" % (name, ", ".join(valid_options))
+                options_text = _ENUM_OPTIONS_TEXT.get(valid_options)
+                if options_text is None:
+                    options_text = ", ".join(sorted(valid_options))
+                message = "%s must be one of %s" % (name, options_text)
             raise ValueError(message)
@@ -23,6 +23,8 @@ TODO: Simplify?
 import json
 import logging
 
+_logger = logging.getLogger(__name__)
+
 
 def build_response(reqid, response_stream):
     """Build a gRPCResponse from response stream.
@@ -52,10 +54,41 @@ def build_response(reqid, response_stream):
     response_obj = gRPCResponse(reqid)
     for response in response_stream:
         response_obj.add_data(response.ReqID, response.YangData, response.Errors)
+    return _finalize_response(response_obj)
+
+
+async def build_response_async(reqid, response_stream):
+    """Build a gRPCResponse from a grpc.aio response stream.
+
+    Parameters
+    ----------
+    reqid : uint
+        The request ID to indicate to the device.
+    response_stream : object, async iterable or awaitable
+        grpc.aio call to consume and assemble. Unary calls are awaited
+        for their single response, streaming calls are iterated.
+
+    Returns
+    -------
+    response_obj : object
+        Response object with ReqID, YangData, and Errors fields.
+    """
+    response_obj = gRPCResponse(reqid)
+    if hasattr(response_stream, "__aiter__"):
+        async for response in response_stream:
+            response_obj.add_data(response.ReqID, response.YangData, response.Errors)
+    else:
+        response = await response_stream
+        response_obj.add_data(response.ReqID, response.YangData, response.Errors)
+    return _finalize_response(response_obj)
+
+
+def _finalize_response(response_obj):
+    """Finalize a fully assembled gRPCResponse, tolerating bad JSON."""
     try:
         response_obj.finalize()
     except json.decoder.JSONDecodeError:
-        logging.exception('Error finalizing response JSON! Returning potentially un-finalized elements.')
+        _logger.exception('Error finalizing response JSON! Returning potentially un-finalized elements.')
     return response_obj
 
 
@@ -33,17 +33,18 @@ DESCRIPTION = 'NX-OS gRPC Python connectivity library.'
 URL = 'https://github.com/cisco-grpc-connection-libs/nx-os-grpc-python'
 EMAIL = 'cisco-ie@cisco.com'
 AUTHOR = 'cisco-ie'
-REQUIRES_PYTHON = '>=2.7.0'
+REQUIRES_PYTHON = '>=3.6.0'
 VERSION = '0.1.1'
 
 # What packages are required for this module to be executed?
 REQUIRED = [
-    'grpcio', 'protobuf',
+    'grpcio>=1.32.0', 'protobuf',
 ]
 
 # What packages are optional?
 EXTRAS = {
-    # 'fancy feature': ['django'],
+    # Faster JSON encoding of XPath requests.
+    'orjson': ['orjson'],
 }
 
 # The rest you shouldn't have to touch too much :)
@@ -94,8 +95,8 @@ class UploadCommand(Command):
         except OSError:
             pass
 
-        self.status('Building Source and Wheel (universal) distribution…')
-        os.system('{0} setup.py sdist bdist_wheel --universal'.format(sys.executable))
+        self.status('Building Source and Wheel distribution…')
+        os.system('{0} setup.py sdist bdist_wheel'.format(sys.executable))
 
         self.status('Uploading the package to PyPI via Twine…')
         os.system('twine upload dist/*')
@@ -133,10 +134,9 @@ setup(
         'License :: OSI Approved :: Apache Software License',
         'Natural Language :: English',
         'Programming Language :: Python',
-        'Programming Language :: Python :: 2',
-        'Programming Language :: Python :: 2.7',
         'Programming Language :: Python :: 3',
         'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3 :: Only',
         'Topic :: Software Development :: Libraries :: Python Modules',
         'Topic :: System :: Networking',
         'Topic :: System :: Networking :: Monitoring',